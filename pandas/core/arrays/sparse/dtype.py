@@ -1,14 +1,19 @@
 """Sparse Dtype"""
 
-import re
+import sys
 from typing import Any
 
 import numpy as np
 
+from pandas._libs.tslibs import NaT
+
 from pandas.core.dtypes.base import ExtensionDtype
 from pandas.core.dtypes.cast import astype_nansafe
 from pandas.core.dtypes.common import (
+    is_bool,
     is_bool_dtype,
+    is_float,
+    is_integer,
     is_object_dtype,
     is_scalar,
     is_string_dtype,
@@ -20,6 +25,22 @@ from pandas.core.dtypes.missing import isna, na_value_for_dtype
 from pandas._typing import Dtype
 
 
+def _is_na_scalar(fill_value) -> bool:
+    """
+    Check whether a fill value is NA.
+
+    The common fill values (NaN, NaT, None, integers) are handled directly
+    to avoid the full dispatch of ``isna``.
+    """
+    if fill_value is None or fill_value is NaT:
+        return True
+    if isinstance(fill_value, float):
+        return bool(fill_value != fill_value)
+    if isinstance(fill_value, int):
+        return False
+    return bool(isna(fill_value))
+
+
 @register_extension_dtype
 class SparseDtype(ExtensionDtype):
     """
@@ -63,6 +84,7 @@ class SparseDtype(ExtensionDtype):
     # Without is_na_fill_value in the comparison, those would be equal since
     # hash(nan) is (sometimes?) 0.
     _metadata = ("_dtype", "_fill_value", "_is_na_fill_value")
+    __slots__ = ("_dtype", "_fill_value", "_is_na_fill_value", "_name")
 
     def __init__(self, dtype: Dtype = np.float64, fill_value: Any = None) -> None:
 
@@ -71,9 +93,14 @@ class SparseDtype(ExtensionDtype):
                 fill_value = dtype.fill_value
             dtype = dtype.subtype
 
-        dtype = pandas_dtype(dtype)
-        if is_string_dtype(dtype):
-            dtype = np.dtype("object")
+        if isinstance(dtype, np.dtype):
+            # already normalized; skip the pandas_dtype roundtrip
+            if dtype.kind in "OSU":
+                dtype = np.dtype("object")
+        else:
+            dtype = pandas_dtype(dtype)
+            if is_string_dtype(dtype):
+                dtype = np.dtype("object")
 
         if fill_value is None:
             fill_value = na_value_for_dtype(dtype)
@@ -84,11 +111,32 @@ class SparseDtype(ExtensionDtype):
             )
         self._dtype = dtype
         self._fill_value = fill_value
+        self._set_derived()
+
+    def _set_derived(self):
+        """
+        Set the attributes derived from ``_dtype`` and ``_fill_value``.
+        """
+        self._is_na_fill_value = _is_na_scalar(self._fill_value)
+        self._name = sys.intern(f"Sparse[{self._dtype.name}, {self._fill_value}]")
+
+    def __getstate__(self):
+        # only pickle the defining attributes; the cached ones are derived
+        # from them in __setstate__
+        return {"_dtype": self._dtype, "_fill_value": self._fill_value}
+
+    def __setstate__(self, state):
+        # for pickle compat. Pickles from older versions don't carry the
+        # cached ``_is_na_fill_value`` and ``_name``, so we recompute them.
+        self._dtype = state["_dtype"]
+        self._fill_value = state["_fill_value"]
+        self._set_derived()
 
     def __hash__(self):
         # Python3 doesn't inherit __hash__ when a base class overrides
-        # __eq__, so we explicitly do it here.
-        return super().__hash__()
+        # __eq__, so we explicitly do it here. The attributes of _metadata
+        # are read directly to avoid the generic getattr loop.
+        return hash((self._dtype, self._fill_value, self._is_na_fill_value))
 
     def __eq__(self, other) -> bool:
         # We have to override __eq__ to handle NA values in _metadata.
@@ -100,20 +148,25 @@ class SparseDtype(ExtensionDtype):
                 return False
 
         if isinstance(other, type(self)):
-            subtype = self.subtype == other.subtype
+            subtype = self._dtype == other._dtype
             if self._is_na_fill_value:
                 # this case is complicated by two things:
                 # SparseDtype(float, float(nan)) == SparseDtype(float, np.nan)
                 # SparseDtype(float, np.nan)     != SparseDtype(float, pd.NaT)
                 # i.e. we want to treat any floating-point NaN as equal, but
                 # not a floating-point NaN and a datetime NaT.
-                fill_value = (
-                    other._is_na_fill_value
-                    and isinstance(self.fill_value, type(other.fill_value))
-                    or isinstance(other.fill_value, type(self.fill_value))
-                )
+                sfv, ofv = self._fill_value, other._fill_value
+                if sfv is ofv:
+                    # the common case of both being the np.nan or NaT singleton
+                    fill_value = True
+                else:
+                    fill_value = (
+                        other._is_na_fill_value
+                        and isinstance(sfv, type(ofv))
+                        or isinstance(ofv, type(sfv))
+                    )
             else:
-                fill_value = self.fill_value == other.fill_value
+                fill_value = self._fill_value == other._fill_value
 
             return subtype and fill_value
         return False
@@ -134,10 +187,6 @@ class SparseDtype(ExtensionDtype):
         """
         return self._fill_value
 
-    @property
-    def _is_na_fill_value(self):
-        return isna(self.fill_value)
-
     @property
     def _is_numeric(self):
         return not is_object_dtype(self.subtype)
@@ -163,7 +212,7 @@ class SparseDtype(ExtensionDtype):
 
     @property
     def name(self):
-        return "Sparse[{}, {}]".format(self.subtype.name, self.fill_value)
+        return self._name
 
     def __repr__(self) -> str:
         return self.name
@@ -244,27 +293,39 @@ class SparseDtype(ExtensionDtype):
         ValueError
             When the subtype cannot be extracted.
         """
-        xpr = re.compile(r"Sparse\[(?P<subtype>[^,]*)(, )?(?P<fill_value>.*?)?\]$")
-        m = xpr.match(dtype)
-        has_fill_value = False
-        if m:
-            subtype = m.groupdict()["subtype"]
-            has_fill_value = m.groupdict()["fill_value"] or has_fill_value
-        elif dtype == "Sparse":
-            subtype = "float64"
-        else:
+        if dtype == "Sparse":
+            return "float64", False
+        if not (dtype.startswith("Sparse[") and dtype.endswith("]")):
             raise ValueError("Cannot parse {}".format(dtype))
-        return subtype, has_fill_value
+
+        # The grammar is simple enough that plain string operations are
+        # much cheaper than a regular expression: the subtype runs up to
+        # the first comma, and anything after an optional ", " is the
+        # fill value.
+        body = dtype[7:-1]
+        comma = body.find(",")
+        if comma == -1:
+            return body, False
+
+        subtype = body[:comma]
+        fill_value = body[comma:]
+        if fill_value.startswith(", "):
+            fill_value = fill_value[2:]
+        return subtype, fill_value or False
 
     @classmethod
     def is_dtype(cls, dtype):
         dtype = getattr(dtype, "dtype", dtype)
+        # check the common non-string cases before any string handling;
+        # cls covers both SparseDtype and arrays whose .dtype is one
+        if isinstance(dtype, (cls, np.dtype)):
+            return True
         if isinstance(dtype, str) and dtype.startswith("Sparse"):
             sub_type, _ = cls._parse_subtype(dtype)
-            dtype = np.dtype(sub_type)
-        elif isinstance(dtype, cls):
+            # raises for an invalid subtype, as before
+            np.dtype(sub_type)
             return True
-        return isinstance(dtype, np.dtype) or dtype == "Sparse"
+        return False
 
     def update_dtype(self, dtype):
         """
@@ -308,7 +369,20 @@ class SparseDtype(ExtensionDtype):
         dtype = pandas_dtype(dtype)
 
         if not isinstance(dtype, cls):
-            fill_value = astype_nansafe(np.array(self.fill_value), dtype).item()
+            fill_value = self._fill_value
+            is_numeric_fill = (
+                is_bool(fill_value) or is_integer(fill_value) or is_float(fill_value)
+            )
+            if is_numeric_fill and isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+                # Numeric scalar to numeric dtype: cast the scalar directly
+                # rather than going through a 0-dim array and astype_nansafe.
+                try:
+                    fill_value = dtype.type(fill_value).item()
+                except (ValueError, OverflowError):
+                    # e.g. NaN to integer; let astype_nansafe raise
+                    fill_value = astype_nansafe(np.array(fill_value), dtype).item()
+            else:
+                fill_value = astype_nansafe(np.array(fill_value), dtype).item()
             dtype = cls(dtype, fill_value=fill_value)
 
         return dtype
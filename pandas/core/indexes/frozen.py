@@ -18,6 +18,16 @@ from pandas.core.base import PandasObject
 from pandas.io.formats.printing import pprint_thing
 
 
+def _frozenlist_disabled(*args, **kwargs):
+    """This method will not function because object is immutable."""
+    raise TypeError("'FrozenList' does not support mutable operations.")
+
+
+def _frozenndarray_disabled(*args, **kwargs):
+    """This method will not function because object is immutable."""
+    raise TypeError("'FrozenNDArray' does not support mutable operations.")
+
+
 class FrozenList(PandasObject, list):
     """
     Container that doesn't allow setting item *but*
@@ -60,17 +70,19 @@ class FrozenList(PandasObject, list):
         diff : FrozenList
             The collection difference between self and other.
         """
-        other = set(other)
-        temp = [x for x in self if x not in other]
+        # bind __contains__ once to save an attribute lookup per element
+        contains = set(other).__contains__
+        temp = [x for x in self if not contains(x)]
         return type(self)(temp)
 
     # TODO: Consider deprecating these in favor of `union` (xref gh-15506)
     __add__ = __iadd__ = union
 
     def __getitem__(self, n):
-        if isinstance(n, slice):
-            return self.__class__(super().__getitem__(n))
-        return super().__getitem__(n)
+        # slice cannot be subclassed, so an exact type check is sufficient
+        if type(n) is slice:
+            return self.__class__(list.__getitem__(self, n))
+        return list.__getitem__(self, n)
 
     def __radd__(self, other):
         if isinstance(other, tuple):
@@ -78,12 +90,23 @@ class FrozenList(PandasObject, list):
         return self.__class__(other + list(self))
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, (tuple, FrozenList)):
-            other = list(other)
+        if isinstance(other, tuple):
+            # compare element-wise rather than materializing list(other);
+            # the identity check mirrors list.__eq__ (e.g. for NaN names)
+            if len(self) != len(other):
+                return False
+            return all(x is y or x == y for x, y in zip(self, other))
         return super().__eq__(other)
 
     __req__ = __eq__
 
+    def __ne__(self, other) -> bool:
+        # list.__ne__ doesn't know about our tuple handling in __eq__
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
     def __mul__(self, other):
         return self.__class__(super().__mul__(other))
 
@@ -93,15 +116,11 @@ class FrozenList(PandasObject, list):
         return self.__class__, (list(self),)
 
     def __hash__(self):
-        return hash(tuple(self))
-
-    def _disabled(self, *args, **kwargs):
-        """This method will not function because object is immutable."""
-        raise TypeError(
-            "'{cls}' does not support mutable operations.".format(
-                cls=self.__class__.__name__
-            )
-        )
+        # FrozenList is immutable, so the hash only needs computing once.
+        result = getattr(self, "_cached_hash", None)
+        if result is None:
+            result = self._cached_hash = hash(tuple(self))
+        return result
 
     def __str__(self) -> str:
         return pprint_thing(self, quote_strings=True, escape_chars=("\t", "\r", "\n"))
@@ -109,8 +128,11 @@ class FrozenList(PandasObject, list):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({str(self)})"
 
+    # staticmethod, so accessing these doesn't create a bound method
+    _disabled = staticmethod(_frozenlist_disabled)
     __setitem__ = __setslice__ = __delitem__ = __delslice__ = _disabled
     pop = append = extend = remove = sort = insert = _disabled
+    clear = reverse = _disabled
 
 
 class FrozenNDArray(PandasObject, np.ndarray):
@@ -129,12 +151,7 @@ class FrozenNDArray(PandasObject, np.ndarray):
         res = np.array(data, dtype=dtype, copy=copy).view(cls)
         return res
 
-    def _disabled(self, *args, **kwargs):
-        """This method will not function because object is immutable."""
-        raise TypeError(
-            "'{cls}' does not support mutable operations.".format(cls=self.__class__)
-        )
-
+    _disabled = staticmethod(_frozenndarray_disabled)
     __setitem__ = __setslice__ = __delitem__ = __delslice__ = _disabled
     put = itemset = fill = _disabled
 
@@ -173,15 +190,18 @@ class FrozenNDArray(PandasObject, np.ndarray):
         # xref: https://github.com/numpy/numpy/issues/5370
         try:
             value = self.dtype.type(value)
-        except ValueError:
+        except (ValueError, TypeError):
             pass
 
-        return super().searchsorted(value, side=side, sorter=sorter)
+        return np.ndarray.searchsorted(self, value, side=side, sorter=sorter)
 
 
 def _ensure_frozen(array_like, categories, copy=False):
     array_like = coerce_indexer_dtype(array_like, categories)
-    array_like = array_like.view(FrozenNDArray)
+    if type(array_like) is not FrozenNDArray:
+        # coerce_indexer_dtype passes through arrays that already have the
+        # right dtype, in which case there is no need for a new view
+        array_like = array_like.view(FrozenNDArray)
     if copy:
         array_like = array_like.copy()
     return array_like
@@ -3,6 +3,7 @@ import pytest
 
 import pandas as pd
 from pandas.core.arrays.sparse import SparseDtype
+import pandas.util.testing as tm
 
 
 @pytest.mark.parametrize(
@@ -98,8 +99,9 @@ def test_is_numeric(dtype, expected):
     assert dtype._is_numeric is expected
 
 
-def test_str_uses_object():
-    result = SparseDtype(str).subtype
+@pytest.mark.parametrize("dtype", [str, np.dtype("U"), np.dtype("S"), "object"])
+def test_str_uses_object(dtype):
+    result = SparseDtype(dtype).subtype
     assert result == np.dtype("object")
 
 
@@ -145,6 +147,8 @@ def test_hash_equal(a, b, expected):
         ("Sparse[int64]", "int64"),
         ("Sparse[int64, 0]", "int64"),
         ("Sparse[datetime64[ns], 0]", "datetime64[ns]"),
+        ("Sparse[datetime64[ns]]", "datetime64[ns]"),
+        ("Sparse", "float64"),
     ],
 )
 def test_parse_subtype(string, expected):
@@ -152,6 +156,21 @@ def test_parse_subtype(string, expected):
     assert subtype == expected
 
 
+@pytest.mark.parametrize(
+    "string, expected",
+    [("Sparse[int]", False), ("Sparse[int, 0]", "0"), ("Sparse[float, nan]", "nan")],
+)
+def test_parse_subtype_fill_value(string, expected):
+    _, result = SparseDtype._parse_subtype(string)
+    assert result == expected
+
+
+@pytest.mark.parametrize("string", ["Sparse[int", "sparse[int]", "Sparse(int)"])
+def test_parse_subtype_raises(string):
+    with pytest.raises(ValueError, match="Cannot parse"):
+        SparseDtype._parse_subtype(string)
+
+
 @pytest.mark.parametrize(
     "string", ["Sparse[int, 1]", "Sparse[float, 0.0]", "Sparse[bool, True]"]
 )
@@ -167,6 +186,9 @@ def test_construct_from_string_fill_value_raises(string):
         (SparseDtype(int, 1), float, SparseDtype(float, 1.0)),
         (SparseDtype(int, 1), str, SparseDtype(object, "1")),
         (SparseDtype(float, 1.5), int, SparseDtype(int, 1)),
+        (SparseDtype(float, np.nan), "float32", SparseDtype("float32", np.nan)),
+        (SparseDtype(int, 1), bool, SparseDtype(bool, True)),
+        (SparseDtype(bool, False), int, SparseDtype(int, 0)),
     ],
 )
 def test_update_dtype(original, dtype, expected):
@@ -176,8 +198,57 @@ def test_update_dtype(original, dtype, expected):
 
 @pytest.mark.parametrize(
     "original, dtype",
-    [(SparseDtype(float, np.nan), int), (SparseDtype(str, "abc"), int)],
+    [
+        (SparseDtype(float, np.nan), int),
+        (SparseDtype(float, np.inf), int),
+        (SparseDtype(str, "abc"), int),
+    ],
 )
 def test_update_dtype_raises(original, dtype):
     with pytest.raises(ValueError):
         original.update_dtype(dtype)
+
+
+@pytest.mark.parametrize(
+    "dtype, fill_value, expected",
+    [
+        (float, np.nan, True),
+        (float, 0.0, False),
+        (int, 0, False),
+        ("datetime64[ns]", pd.NaT, True),
+        (object, None, True),
+        (float, np.float32("nan"), True),
+        (float, np.float64(0), False),
+        (float, np.float64("nan"), True),
+        ("datetime64[ns]", np.datetime64("NaT", "ns"), True),
+        (bool, False, False),
+        (object, "", False),
+    ],
+)
+def test_is_na_fill_value(dtype, fill_value, expected):
+    result = SparseDtype(dtype, fill_value)._is_na_fill_value
+    assert result is expected
+
+
+def test_pickle_roundtrip():
+    dtype = SparseDtype(float, 0.0)
+    result = tm.round_trip_pickle(dtype)
+    assert result == dtype
+    assert result._is_na_fill_value is False
+
+
+@pytest.mark.parametrize(
+    "dtype, expected",
+    [
+        (SparseDtype(int), True),
+        (pd.SparseArray([1, 2]), True),
+        (np.dtype("float64"), True),
+        ("Sparse", True),
+        ("Sparse[int]", True),
+        ("Sparse[float64, nan]", True),
+        ("float64", False),
+        (None, False),
+    ],
+)
+def test_is_dtype(dtype, expected):
+    assert SparseDtype.is_dtype(dtype) is expected
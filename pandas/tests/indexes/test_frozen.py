@@ -1,3 +1,4 @@
+from collections import namedtuple
 import warnings
 
 import numpy as np
@@ -9,7 +10,7 @@ import pandas.util.testing as tm
 
 
 class TestFrozenList(CheckImmutable, CheckStringMixin):
-    mutable_methods = ("extend", "pop", "remove", "insert")
+    mutable_methods = ("extend", "pop", "remove", "insert", "clear", "reverse")
     unicode_container = FrozenList(["\u05d0", "\u05d1", "c"])
 
     def setup_method(self, _):
@@ -26,6 +27,21 @@ class TestFrozenList(CheckImmutable, CheckStringMixin):
         expected = FrozenList([1, 2, 3] + self.lst)
         self.check_result(result, expected)
 
+    def test_add_namedtuple(self):
+        Point = namedtuple("Point", ["x", "y"])
+        other = Point(1, 2)
+
+        result = self.container + other
+        self.check_result(result, FrozenList(self.lst + [1, 2]))
+
+        result = other + self.container
+        self.check_result(result, FrozenList([1, 2] + self.lst))
+
+        result = self.container.union(other)
+        self.check_result(result, FrozenList(self.lst + [1, 2]))
+
+        assert FrozenList([1, 2]) == other
+
     def test_iadd(self):
         q = r = self.container
 
@@ -50,6 +66,57 @@ class TestFrozenList(CheckImmutable, CheckStringMixin):
         expected = FrozenList([1, 3])
         self.check_result(result, expected)
 
+    def test_eq(self):
+        assert self.container == FrozenList(self.lst)
+        assert self.container == tuple(self.lst)
+        assert self.container == self.lst
+        assert not (self.container == tuple(self.lst[:-1]))
+        assert not (self.container == tuple(self.lst[:-1] + [0]))
+
+    def test_ne(self):
+        assert not (self.container != tuple(self.lst))
+        assert not (self.container != FrozenList(self.lst))
+        assert self.container != tuple(self.lst[:-1])
+        assert self.container != tuple(self.lst[:-1] + [0])
+        assert self.container != "abc"
+
+    def test_eq_nan(self):
+        container = FrozenList(["a", np.nan])
+        assert container == ("a", np.nan)
+        assert container == FrozenList(["a", np.nan])
+
+    def test_hash(self):
+        expected = hash(tuple(self.lst))
+        assert hash(self.container) == expected
+        assert hash(self.container) == expected
+        assert hash(self.container[1:]) == hash(tuple(self.lst[1:]))
+
+    @pytest.mark.parametrize("method", ["clear", "reverse", "sort"])
+    def test_hash_no_inplace_mutation(self, method):
+        hash(self.container)
+        msg = "'FrozenList' does not support mutable operations"
+        with pytest.raises(TypeError, match=msg):
+            getattr(self.container, method)()
+        assert hash(self.container) == hash(tuple(self.lst))
+
+    def test_imul(self):
+        q = r = self.container
+        hash(r)
+
+        q *= 2
+        self.check_result(q, self.lst * 2)
+
+        # Other shouldn't be mutated.
+        self.check_result(r, self.lst)
+        assert hash(r) == hash(tuple(self.lst))
+
+    def test_mutable_error_message(self):
+        msg = "'FrozenList' does not support mutable operations"
+        with pytest.raises(TypeError, match=msg):
+            self.container.append(6)
+        with pytest.raises(TypeError, match=msg):
+            self.container[0] = 6
+
     def test_tricky_container_to_bytes_raises(self):
         # GH 26447
         msg = "^'str' object cannot be interpreted as an integer$"
@@ -75,6 +142,13 @@ class TestFrozenNDArray(CheckImmutable, CheckStringMixin):
         with tm.assert_produces_warning(FutureWarning):
             FrozenNDArray([1, 2, 3])
 
+    def test_mutable_error_message(self):
+        msg = "'FrozenNDArray' does not support mutable operations"
+        with pytest.raises(TypeError, match=msg):
+            self.container.fill(0)
+        with pytest.raises(TypeError, match=msg):
+            self.container[0] = 6
+
     def test_tricky_container_to_bytes(self):
         bytes(self.unicode_container)
 
@@ -113,3 +187,16 @@ class TestFrozenNDArray(CheckImmutable, CheckStringMixin):
         assert self.container.searchsorted(7) == expected
 
         assert self.container.searchsorted(value=7) == expected
+
+    def test_searchsorted_array(self):
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("ignore", FutureWarning)
+            container = FrozenNDArray([-2, 3, 5, 7], dtype=np.int8)
+
+        result = container.searchsorted(np.array([3, 6, 8]))
+        expected = np.array([1, 3, 4], dtype=np.intp)
+        tm.assert_numpy_array_equal(result, expected)
+
+        result = container.searchsorted([3, 6, 8], side="right")
+        expected = np.array([2, 3, 4], dtype=np.intp)
+        tm.assert_numpy_array_equal(result, expected)